@@ -0,0 +1,109 @@
+# conftest.py
+"""Shared pytest fixtures for the unit and integration suites."""
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+project_root = Path(__file__).resolve().parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+# Per-worker shared-cache in-memory database: each pytest-xdist worker
+# gets an isolated DB with zero disk I/O, and every connection from the
+# same worker sees the same data. The session-scoped engine's pooled
+# connection keeps the database alive between tests.
+worker_id = os.environ.get("PYTEST_XDIST_WORKER", "gw0")
+TEST_DATABASE_URL = (
+    f"sqlite:///file:memdb_{worker_id}?mode=memory&cache=shared&uri=true"
+)
+
+
+@pytest.fixture(scope="session")
+def test_engine():
+    """Throwaway in-memory SQLite engine with the schema created once."""
+    from sqlalchemy import create_engine
+
+    from src.core.database import Base
+
+    engine = create_engine(
+        TEST_DATABASE_URL, connect_args={"check_same_thread": False}
+    )
+    Base.metadata.create_all(bind=engine)
+    yield engine
+    Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def testing_session_factory(test_engine):
+    from sqlalchemy.orm import sessionmaker
+
+    return sessionmaker(autocommit=False, autoflush=False, bind=test_engine)
+
+
+@pytest.fixture(scope="session")
+def app_with_test_db(test_engine):
+    """The FastAPI app with the throwaway database schema ready.
+
+    Deliberately does NOT install a get_db override: the app object is
+    shared with the integration suite, so a session-long override here
+    would leak the test database into any suite collected after this
+    one. Tests that want the throwaway database install a function-
+    scoped override (see db_session in test_api_routes.py) and remove it
+    on teardown.
+    """
+    from main import app
+
+    yield app
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip API tests at collection time if the app cannot be imported."""
+    try:
+        import main  # noqa: F401
+    except Exception as exc:
+        skip_api = pytest.mark.skip(reason=f"main import failed: {exc}")
+        for item in items:
+            if "api_client" in getattr(item, "fixturenames", ()):
+                item.add_marker(skip_api)
+
+
+@pytest.fixture(scope="session")
+def api_client():
+    """One context-managed TestClient for the whole session.
+
+    Entering the context runs the app lifespan (DB engine, retriever,
+    orchestrator singletons) exactly once; shutdown fires at session
+    end instead of per test.
+    """
+    from fastapi.testclient import TestClient
+
+    from main import app
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def parsed_brand_doc():
+    """Parse the brand brief once per session; tests share the dict."""
+    from src.processing.document_parser import CampaignDocumentParser
+
+    doc_path = project_root / "data" / "brand_guidelines.docx"
+    if not doc_path.exists():
+        pytest.skip("Brand brief document not available")
+    return CampaignDocumentParser().parse_document(str(doc_path), "docx")
+
+
+@pytest.fixture(scope="session")
+def brand_retriever():
+    """Session-scoped retriever: the FAISS index is read from disk once."""
+    from src.rag.retriever import BrandGuidelineRetriever
+
+    index_path = project_root / "data" / "vectordb" / "faiss" / "brand_index.bin"
+    if not index_path.exists():
+        pytest.skip("Brand knowledge base not built")
+    return BrandGuidelineRetriever(data_dir=str(project_root / "data"), mmap=True)
@@ -1 +1,26 @@
 # main.py
+"""FastAPI backend entry point."""
+
+from pathlib import Path
+
+from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.staticfiles import StaticFiles
+
+from src.core.database import Base, engine
+from src.routes.api_routes import router
+
+Base.metadata.create_all(bind=engine)
+
+app = FastAPI(title="Agentic CX Content Studio", version="1.0.0")
+app.add_middleware(GZipMiddleware, minimum_size=1024)
+app.include_router(router)
+
+_STATIC_DIR = Path(__file__).resolve().parent / "static"
+_STATIC_DIR.mkdir(exist_ok=True)
+app.mount("/static", StaticFiles(directory=str(_STATIC_DIR)), name="static")
+
+
+@app.get("/health")
+def health():
+    return {"status": "ok"}
@@ -1 +1,10 @@
+#!/usr/bin/env bash
 # run_test.sh
+# Run the test suite in parallel. loadgroup honors the
+# xdist_group("orchestrator") markers so the LLM-backed tests serialize
+# on one worker while everything else fans out across cores. Each worker
+# gets its own shared-cache in-memory SQLite database (see the root
+# conftest.py).
+set -e
+
+python -m pytest test -n auto --dist=loadgroup "$@"
@@ -0,0 +1,55 @@
+# brand_kb_loader.py
+"""Load brand knowledge-base rules (forbidden language, tone, keywords)."""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+_DEFAULT_KB = {
+    "forbidden_language": {
+        "forbidden_terms": ["cheap", "guaranteed", "spam", "scam"],
+        "allowed_phrases": ["premium quality", "trusted by customers"],
+    },
+    "tone_profile": {
+        "preferred_tone": ["inspiring", "innovative", "together", "empower", "achieve"],
+        "disallowed_tone": ["aggressive", "pushy", "desperate", "urgent"],
+    },
+    "required_keywords": [],
+}
+
+
+class BrandKBLoader:
+    """Read brand rules from JSON files under ``kb_path``.
+
+    Missing files fall back to the built-in defaults so the validator
+    stays usable before any brand guidelines have been uploaded.
+    """
+
+    def __init__(self, kb_path: str = "data/brand_kb"):
+        self.kb_path = Path(kb_path)
+
+    def _load_json(self, name: str, default):
+        path = self.kb_path / f"{name}.json"
+        if path.exists():
+            return json.loads(path.read_text(encoding="utf-8"))
+        return default
+
+    def load_forbidden_language(self) -> dict:
+        return self._load_json("forbidden_language", _DEFAULT_KB["forbidden_language"])
+
+    def get_all_forbidden_terms(self) -> list:
+        return list(self.load_forbidden_language().get("forbidden_terms", []))
+
+    def get_all_allowed_phrases(self) -> list:
+        return list(self.load_forbidden_language().get("allowed_phrases", []))
+
+    def load_tone_profile(self) -> dict:
+        return self._load_json("tone_profile", _DEFAULT_KB["tone_profile"])
+
+    def get_required_keywords(self) -> list:
+        return list(self._load_json("required_keywords", _DEFAULT_KB["required_keywords"]))
+
+
+@lru_cache(maxsize=None)
+def get_kb_loader(kb_path: str = "data/brand_kb") -> BrandKBLoader:
+    return BrandKBLoader(kb_path)
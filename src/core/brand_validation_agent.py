@@ -1 +1,309 @@
 # brand_validation_agent.py
+"""Brand validation agent: checks generated copy against the brand KB."""
+
+import bisect
+import re
+import string
+from dataclasses import dataclass
+from enum import Enum
+from functools import lru_cache
+from pathlib import Path
+from typing import NamedTuple
+
+import ahocorasick
+import marisa_trie
+
+from src.core.brand_kb_loader import get_kb_loader
+
+# Maps punctuation to spaces so "awful." tokenizes to "awful".
+_PUNCT_TABLE = str.maketrans(string.punctuation, " " * len(string.punctuation))
+
+# Below this many single-word terms the regex alternation wins; past it,
+# compiling and holding the alternation per worker gets expensive and the
+# terms move into a static marisa trie instead.
+_TRIE_MIN_TERMS = 2048
+
+
+def _build_automaton(terms):
+    """Compile a list of phrases into an Aho-Corasick automaton.
+
+    Returns None for an empty term list so callers can skip the scan.
+    """
+    if not terms:
+        return None
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term.casefold(), term)
+    automaton.make_automaton()
+    return automaton
+
+
+def _build_forbidden_re(terms):
+    """Compile the forbidden terms into one word-boundary alternation.
+
+    Longest-first ordering makes the alternation prefer "price gouging"
+    over "price"; the \\b anchors stop "cheapest" matching "cheap".
+    Returns None for an empty term list.
+    """
+    if not terms:
+        return None
+    alternation = "|".join(
+        map(re.escape, sorted((term.casefold() for term in terms), key=len, reverse=True))
+    )
+    return re.compile(r"\b(?:" + alternation + r")\b")
+
+
+def _build_forbidden_matchers(forbidden, kb_path):
+    """Pick the forbidden-term matchers for the KB size.
+
+    Small KBs compile everything into the word-boundary alternation. Past
+    _TRIE_MIN_TERMS single-word terms, those terms go into a static
+    marisa trie — mmap-shareable across workers and a fraction of the
+    memory of a set — persisted beside the KB so later processes load it
+    without rebuilding. Multi-word phrases always stay in the regex,
+    since token lookup cannot see across word gaps.
+
+    Returns (regex, trie, regex_terms); regex_terms is exactly the term
+    set the regex covers, so the bytes pre-screen can gate the sweep
+    without re-scanning terms the trie already handles per token.
+    """
+    single = [term for term in forbidden if " " not in term]
+    if len(single) < _TRIE_MIN_TERMS:
+        return _build_forbidden_re(forbidden), None, forbidden
+
+    phrases = tuple(term for term in forbidden if " " in term)
+    trie_path = Path(kb_path) / "forbidden.marisa"
+    if trie_path.exists():
+        trie = marisa_trie.Trie()
+        trie.mmap(str(trie_path))
+    else:
+        trie = marisa_trie.Trie(term.casefold() for term in single)
+        if trie_path.parent.is_dir():
+            trie.save(str(trie_path))
+    return _build_forbidden_re(phrases), trie, phrases
+
+
+class _CompiledKB(NamedTuple):
+    forbidden_terms: tuple
+    allowed_phrases: tuple
+    tone_profile: dict
+    required_keywords: tuple
+    forbidden_re: "re.Pattern | None"
+    forbidden_bytes: tuple
+    forbidden_trie: "marisa_trie.Trie | None"
+    term_lookup: dict
+    allowed_ac: "ahocorasick.Automaton | None"
+    preferred: frozenset
+    disallowed: frozenset
+
+
+@lru_cache(maxsize=None)
+def _compile_kb(kb_path: str) -> _CompiledKB:
+    """Load the KB once per path and compile its matching structures.
+
+    Caching at module level means every BrandValidator pointed at the
+    same KB shares one set of compiled matchers instead of rebuilding
+    them per instance. Tests that patch get_kb_loader call cache_clear()
+    between cases (see the unit conftest).
+    """
+    kb = get_kb_loader(kb_path)
+    forbidden = tuple(kb.get_all_forbidden_terms())
+    allowed = tuple(kb.get_all_allowed_phrases())
+    tone_profile = kb.load_tone_profile()
+    required = tuple(kb.get_required_keywords())
+    forbidden_re, forbidden_trie, regex_terms = _build_forbidden_matchers(
+        forbidden, kb_path
+    )
+    return _CompiledKB(
+        forbidden_terms=forbidden,
+        allowed_phrases=allowed,
+        tone_profile=tone_profile,
+        required_keywords=required,
+        forbidden_re=forbidden_re,
+        forbidden_bytes=tuple(
+            sorted({term.casefold().encode("utf-8") for term in regex_terms})
+        ),
+        forbidden_trie=forbidden_trie,
+        term_lookup={term.casefold(): term for term in forbidden},
+        allowed_ac=_build_automaton(allowed),
+        preferred=frozenset(
+            word.casefold() for word in tone_profile.get("preferred_tone", ())
+        ),
+        disallowed=frozenset(
+            word.casefold() for word in tone_profile.get("disallowed_tone", ())
+        ),
+    )
+
+
+class Tone(Enum):
+    POSITIVE = "positive"
+    NEGATIVE = "negative"
+    NEUTRAL = "neutral"
+
+
+@dataclass(slots=True)
+class ValidationResult:
+    is_valid: bool
+    violations: list
+    warnings: list
+    detected_tone: Tone
+    missing_keywords: list
+    forbidden_words_found: list
+
+    def to_dict(self) -> dict:
+        # A literal dict avoids asdict's recursive deep copy of the lists.
+        return {
+            "is_valid": self.is_valid,
+            "violations": self.violations,
+            "warnings": self.warnings,
+            "detected_tone": self.detected_tone.value,
+            "missing_keywords": self.missing_keywords,
+            "forbidden_words_found": self.forbidden_words_found,
+        }
+
+
+class BrandValidator:
+    """Rule-based validator enforcing forbidden terms, tone and keywords."""
+
+    def __init__(self, kb_path: str = "data/brand_kb"):
+        compiled = _compile_kb(kb_path)
+        self.all_forbidden_terms = compiled.forbidden_terms
+        self.all_allowed_phrases = compiled.allowed_phrases
+        self.tone_profile = compiled.tone_profile
+        self.required_keywords = compiled.required_keywords
+        self._forbidden_re = compiled.forbidden_re
+        self._forbidden_bytes = compiled.forbidden_bytes
+        self._forbidden_trie = compiled.forbidden_trie
+        self._term_lookup = compiled.term_lookup
+        self._allowed_ac = compiled.allowed_ac
+        self._preferred = compiled.preferred
+        self._disallowed = compiled.disallowed
+
+    def _detect_tone(self, words: set) -> Tone:
+        # Frozenset intersection is a C-level hashed probe per word,
+        # versus a Python list scan per word in the old loop.
+        positive_hits = len(self._preferred & words)
+        negative_hits = len(self._disallowed & words)
+        if negative_hits > positive_hits:
+            return Tone.NEGATIVE
+        if positive_hits > 0:
+            return Tone.POSITIVE
+        return Tone.NEUTRAL
+
+    def _empty_result(self) -> ValidationResult:
+        return ValidationResult(
+            is_valid=False,
+            violations=["Text is empty"],
+            warnings=[],
+            detected_tone=Tone.NEUTRAL,
+            missing_keywords=list(self.required_keywords),
+            forbidden_words_found=[],
+        )
+
+    def _may_contain_forbidden(self, normalized: str) -> bool:
+        """Cheap substring pre-screen before the regex sweep.
+
+        bytes.find dispatches to CPython's fastsearch scanner; for clean
+        copy — the common case — every needle misses and validate never
+        pays for the alternation. False positives (e.g. "cheapest") are
+        fine: the word-boundary regex still has the final say.
+        """
+        haystack = normalized.encode("utf-8")
+        return any(haystack.find(needle) >= 0 for needle in self._forbidden_bytes)
+
+    def _scan_trie(self, normalized: str, found: dict) -> None:
+        if self._forbidden_trie is not None:
+            for token in dict.fromkeys(normalized.split()):
+                if token in self._forbidden_trie:
+                    found.setdefault(self._term_lookup[token], None)
+
+    def _build_result(self, normalized: str, found: dict) -> ValidationResult:
+        """Assemble a ValidationResult from pre-scanned forbidden matches."""
+        violations = [f"Forbidden term used: '{term}'" for term in found]
+        warnings = []
+
+        if self._allowed_ac is not None and next(
+            self._allowed_ac.iter(normalized), None
+        ) is None:
+            warnings.append("No approved brand phrasing found")
+
+        missing_keywords = [
+            keyword
+            for keyword in self.required_keywords
+            if keyword.casefold() not in normalized
+        ]
+        for keyword in missing_keywords:
+            warnings.append(f"Missing required keyword: '{keyword}'")
+
+        detected_tone = self._detect_tone(set(normalized.split()))
+        if detected_tone is Tone.NEGATIVE:
+            violations.append("Disallowed tone detected")
+
+        return ValidationResult(
+            is_valid=not violations,
+            violations=violations,
+            warnings=warnings,
+            detected_tone=detected_tone,
+            missing_keywords=missing_keywords,
+            forbidden_words_found=list(found),
+        )
+
+    def validate(self, text: str) -> ValidationResult:
+        if not text or not text.strip():
+            return self._empty_result()
+
+        # One normalized copy feeds every scanner below; none of them
+        # lowercases again, so a 5 KB text is copied once, not four times.
+        normalized = text.casefold().translate(_PUNCT_TABLE)
+
+        # One precompiled C-level sweep over the text; dict keys dedupe
+        # repeated matches while keeping first-match order.
+        found = {}
+        if self._forbidden_re is not None and self._may_contain_forbidden(normalized):
+            for match in self._forbidden_re.finditer(normalized):
+                found.setdefault(self._term_lookup[match.group(0)], None)
+        self._scan_trie(normalized, found)
+        return self._build_result(normalized, found)
+
+    def validate_batch(self, texts: list) -> list:
+        """Validate N variants with one forbidden-term sweep.
+
+        The normalized texts are joined on "\\x1f" — a control character
+        that never survives generation and breaks any word boundary — so
+        the precompiled regex runs once over the whole batch; bisect on
+        the per-text offsets maps each match back to its owner.
+        """
+        results = [None] * len(texts)
+        normalized_texts = []
+        owners = []
+        for index, text in enumerate(texts):
+            if not text or not text.strip():
+                results[index] = self._empty_result()
+            else:
+                owners.append(index)
+                normalized_texts.append(text.casefold().translate(_PUNCT_TABLE))
+
+        found_maps = [{} for _ in normalized_texts]
+        if self._forbidden_re is not None and normalized_texts:
+            offsets = []
+            position = 0
+            for normalized in normalized_texts:
+                offsets.append(position)
+                position += len(normalized) + 1
+            joined = "\x1f".join(normalized_texts)
+            if self._may_contain_forbidden(joined):
+                for match in self._forbidden_re.finditer(joined):
+                    slot = bisect.bisect_right(offsets, match.start()) - 1
+                    found_maps[slot].setdefault(
+                        self._term_lookup[match.group(0)], None
+                    )
+
+        for normalized, found, owner in zip(normalized_texts, found_maps, owners):
+            self._scan_trie(normalized, found)
+            results[owner] = self._build_result(normalized, found)
+        return results
+
+
+@lru_cache(maxsize=None)
+def get_brand_validator(kb_path: str = "data/brand_kb") -> BrandValidator:
+    return BrandValidator(kb_path)
@@ -0,0 +1,62 @@
+# database.py
+"""SQLAlchemy engine, session factory and ORM models."""
+
+import os
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import DateTime, ForeignKey, String, Text, create_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship, sessionmaker
+
+DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/postgresdb/campaigns.db")
+
+_connect_args = {"check_same_thread": False} if DATABASE_URL.startswith("sqlite") else {}
+engine = create_engine(DATABASE_URL, connect_args=_connect_args, pool_pre_ping=True)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Campaign(Base):
+    __tablename__ = "campaigns"
+
+    campaign_id: Mapped[str] = mapped_column(
+        String(32), primary_key=True, default=lambda: uuid4().hex
+    )
+    campaign_name: Mapped[str] = mapped_column(String(255))
+    brand_name: Mapped[str] = mapped_column(String(255), default="")
+    objective: Mapped[str] = mapped_column(Text, default="")
+    target_audience: Mapped[str] = mapped_column(Text, default="")
+    key_message: Mapped[str] = mapped_column(Text, default="")
+    status: Mapped[str] = mapped_column(String(32), default="draft")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    results: Mapped[list["TextContent"]] = relationship(
+        back_populates="campaign", cascade="all, delete-orphan"
+    )
+
+
+class TextContent(Base):
+    __tablename__ = "text_contents"
+
+    text_id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    campaign_id: Mapped[str] = mapped_column(
+        ForeignKey("campaigns.campaign_id", ondelete="CASCADE")
+    )
+    generated_text: Mapped[str] = mapped_column(Text, default="")
+    image_url: Mapped[str] = mapped_column(String(512), default="")
+    agent_name: Mapped[str] = mapped_column(String(64), default="Writer")
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+
+    campaign: Mapped[Campaign] = relationship(back_populates="results")
+
+
+def get_db():
+    """FastAPI dependency yielding a request-scoped session."""
+    db = SessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
@@ -1 +1,58 @@
 # image_content_gen.py
+"""Replicate-backed image generation for campaign visuals."""
+
+import os
+from functools import lru_cache
+
+import mlflow
+import replicate
+from dotenv import load_dotenv
+
+DEFAULT_MODEL = "black-forest-labs/flux-schnell"
+
+
+@lru_cache(maxsize=1)
+def _env_loaded() -> bool:
+    """Parse .env once per process instead of per generator construction."""
+    load_dotenv()
+    return True
+
+
+class ImageGenerator:
+    """Thin wrapper around the Replicate image-generation API."""
+
+    def __init__(self, model: str = DEFAULT_MODEL):
+        _env_loaded()
+        if not os.getenv("REPLICATE_API_TOKEN"):
+            raise ValueError("REPLICATE_API_TOKEN is not set")
+        self.model = model
+        # Instance-level memo: campaigns routinely regenerate the same
+        # prompt, and a cache hit costs microseconds instead of an API
+        # call billed per image.
+        self._generate_cached = lru_cache(maxsize=256)(self._raw_generate)
+
+    def _raw_generate(self, prompt: str, width: int, height: int, seed) -> str:
+        inputs = {"prompt": prompt, "width": width, "height": height}
+        if seed is not None:
+            inputs["seed"] = seed
+        with mlflow.start_run(run_name="image_generation", nested=True):
+            mlflow.log_param("model", self.model)
+            mlflow.log_param("prompt", prompt)
+            output = replicate.run(self.model, input=inputs)
+        if isinstance(output, (list, tuple)):
+            return str(output[0])
+        return str(output)
+
+    def generate(
+        self,
+        prompt: str,
+        width: int = 1024,
+        height: int = 1024,
+        seed: int = None,
+    ) -> str:
+        return self._generate_cached(prompt, width, height, seed)
+
+
+@lru_cache(maxsize=1)
+def get_image_generator() -> ImageGenerator:
+    return ImageGenerator()
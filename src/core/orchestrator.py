@@ -0,0 +1,79 @@
+# orchestrator.py
+"""Orchestrates planner, writer, image and validator agents for a campaign."""
+
+from functools import lru_cache
+
+from src.core.brand_validation_agent import get_brand_validator
+from src.core.image_content_gen import get_image_generator
+from src.core.text_content_gen import get_text_generator
+from src.prompt.image_temp import IMAGE_PROMPT
+from src.prompt.planner_temp import PLANNER_PROMPT
+from src.prompt.writer_temp import REGENERATION_FEEDBACK, WRITER_PROMPT
+
+
+class ContentOrchestrationCrew:
+    """Run the plan → write → illustrate → validate pipeline."""
+
+    def __init__(self, data_dir: str = "data"):
+        self.text_generator = get_text_generator()
+        self.image_generator = get_image_generator()
+        self.validator = get_brand_validator()
+        try:
+            from src.rag.retriever import get_brand_retriever
+
+            self.retriever = get_brand_retriever(data_dir=data_dir)
+        except FileNotFoundError:
+            self.retriever = None
+
+    def _guideline_context(self, query: str) -> str:
+        if self.retriever is None:
+            return "No brand guidelines uploaded."
+        return self.retriever._run(query)
+
+    def run_campaign(self, inputs: dict, feedback: str = "") -> dict:
+        """Single-shot campaign generation. Returns a structured outcome dict."""
+        plan = self.text_generator.generate_text(PLANNER_PROMPT.format(**inputs))
+        context = self._guideline_context(
+            f"Tone and terminology guidelines for {inputs.get('brand_name', '')}"
+        )
+        copy = self.text_generator.generate_text(
+            WRITER_PROMPT.format(
+                plan=plan,
+                context=context,
+                key_message=inputs.get("key_message", ""),
+                feedback=feedback,
+            )
+        )
+        image_url = self.image_generator.generate(
+            IMAGE_PROMPT.format(
+                campaign_name=inputs.get("campaign_name", ""),
+                brand_name=inputs.get("brand_name", ""),
+                key_message=inputs.get("key_message", ""),
+            )
+        )
+        validation = self.validator.validate(copy)
+        return {
+            "status": "approved" if validation.is_valid else "rejected",
+            "attempts": 1,
+            "result": {"text": copy, "image_url": image_url},
+            "validation": validation.to_dict(),
+        }
+
+    def run_with_auto_regeneration(self, inputs: dict, max_attempts: int = 3) -> dict:
+        """Re-run generation with validator feedback until approved."""
+        feedback = ""
+        outcome = None
+        for attempt in range(1, max_attempts + 1):
+            outcome = self.run_campaign(inputs, feedback=feedback)
+            outcome["attempts"] = attempt
+            if outcome["status"] == "approved":
+                break
+            feedback = REGENERATION_FEEDBACK.format(
+                violations="\n".join(outcome["validation"]["violations"])
+            )
+        return outcome
+
+
+@lru_cache(maxsize=1)
+def get_orchestrator() -> ContentOrchestrationCrew:
+    return ContentOrchestrationCrew()
@@ -1 +1,96 @@
 # text_content_gen.py
+"""Groq-backed text generation for campaign copy."""
+
+import asyncio
+import os
+from functools import lru_cache
+
+import mlflow
+from dotenv import load_dotenv
+from groq import AsyncGroq, Groq
+
+DEFAULT_MODEL = "llama-3.3-70b-versatile"
+
+
+@lru_cache(maxsize=1)
+def _env_loaded() -> bool:
+    """Parse .env once per process instead of per generator construction."""
+    load_dotenv()
+    return True
+
+
+class TextGenerator:
+    """Thin wrapper around the Groq chat-completions API."""
+
+    def __init__(self, model: str = DEFAULT_MODEL):
+        _env_loaded()
+        api_key = os.getenv("GROQ_API_KEY")
+        if not api_key:
+            raise ValueError("GROQ_API_KEY is not set")
+        self.client = Groq(api_key=api_key)
+        self.aclient = AsyncGroq(api_key=api_key)
+        self.model = model
+
+    def generate_text(
+        self,
+        prompt: str,
+        system_prompt: str = "You are a senior marketing copywriter.",
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+    ) -> str:
+        with mlflow.start_run(run_name="text_generation", nested=True):
+            mlflow.log_param("model", self.model)
+            mlflow.log_param("temperature", temperature)
+            response = self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {"role": "system", "content": system_prompt},
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=temperature,
+                max_tokens=max_tokens,
+            )
+            mlflow.log_metric("total_tokens", response.usage.total_tokens)
+        return response.choices[0].message.content
+
+    async def agenerate_text(
+        self,
+        prompt: str,
+        system_prompt: str = "You are a senior marketing copywriter.",
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+    ) -> str:
+        """Async variant of generate_text for concurrent batches.
+
+        Skips per-call MLflow runs: nested tracking from interleaved
+        coroutines produces garbage run trees.
+        """
+        response = await self.aclient.chat.completions.create(
+            model=self.model,
+            messages=[
+                {"role": "system", "content": system_prompt},
+                {"role": "user", "content": prompt},
+            ],
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+        return response.choices[0].message.content
+
+    def generate_batch(self, prompts: list, **kwargs) -> list:
+        """Generate copy for many prompts with overlapped round trips.
+
+        N sequential calls pay N network RTTs; gathering the async calls
+        bounds the batch by the slowest single completion.
+        """
+
+        async def _gather():
+            return await asyncio.gather(
+                *(self.agenerate_text(prompt, **kwargs) for prompt in prompts)
+            )
+
+        return list(asyncio.run(_gather()))
+
+
+@lru_cache(maxsize=1)
+def get_text_generator() -> TextGenerator:
+    return TextGenerator()
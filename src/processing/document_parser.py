@@ -0,0 +1,77 @@
+# document_parser.py
+"""Extract campaign details from uploaded brief documents (PDF, DOCX, TXT)."""
+
+import io
+import re
+from pathlib import Path
+
+_FIELD_PATTERNS = {
+    "campaign_name": re.compile(r"campaign\s*name\s*[:\-]\s*(.+)", re.IGNORECASE),
+    "brand_name": re.compile(r"brand(?:\s*name)?\s*[:\-]\s*(.+)", re.IGNORECASE),
+    "objective": re.compile(r"objective\s*[:\-]\s*(.+)", re.IGNORECASE),
+    "target_audience": re.compile(r"(?:target\s*)?audience\s*[:\-]\s*(.+)", re.IGNORECASE),
+    "key_message": re.compile(r"key\s*message\s*[:\-]\s*(.+)", re.IGNORECASE),
+}
+
+
+def _read_pdf(stream) -> str:
+    from PyPDF2 import PdfReader
+
+    reader = PdfReader(stream)
+    return "\n".join(page.extract_text() or "" for page in reader.pages)
+
+
+def _read_docx(stream) -> str:
+    from docx import Document
+
+    document = Document(stream)
+    return "\n".join(paragraph.text for paragraph in document.paragraphs)
+
+
+def _read_txt(stream) -> str:
+    data = stream.read()
+    if isinstance(data, bytes):
+        return data.decode("utf-8", errors="replace")
+    return data
+
+
+_READERS = {
+    "pdf": _read_pdf,
+    "docx": _read_docx,
+    "txt": _read_txt,
+}
+
+
+def _extract_fields(text: str) -> dict:
+    """Pull labelled campaign fields out of the raw brief text."""
+    extracted = {"raw_text": text}
+    for field, pattern in _FIELD_PATTERNS.items():
+        match = pattern.search(text)
+        if match:
+            extracted[field] = match.group(1).strip()
+    return extracted
+
+
+class CampaignDocumentParser:
+    """Parse campaign brief documents into a dict of campaign fields."""
+
+    def parse_document(self, file_path: str, file_type: str) -> dict:
+        file_type = file_type.lower().lstrip(".")
+        reader = _READERS.get(file_type)
+        if reader is None:
+            raise ValueError(f"Unsupported document type: {file_type}")
+        with open(file_path, "rb") as stream:
+            text = reader(stream)
+        return _extract_fields(text)
+
+
+def parse_uploaded_document(uploaded_file) -> dict:
+    """Parse a file-like upload (e.g. a Streamlit ``UploadedFile``)."""
+    file_type = Path(getattr(uploaded_file, "name", "")).suffix.lstrip(".").lower()
+    reader = _READERS.get(file_type)
+    if reader is None:
+        raise ValueError(f"Unsupported document type: {file_type}")
+    data = uploaded_file.read()
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return _extract_fields(reader(io.BytesIO(data)))
@@ -1 +1,7 @@
 # image_temp.py
+"""Prompt template for the image generation agent."""
+
+IMAGE_PROMPT = """Professional marketing visual for the '{campaign_name}' campaign
+by {brand_name}. Theme: {key_message}. Clean composition, on-brand colours,
+no text overlays, high quality, photorealistic.
+"""
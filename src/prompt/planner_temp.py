@@ -1 +1,14 @@
 # planner_temp.py
+"""Prompt template for the campaign planner agent."""
+
+PLANNER_PROMPT = """You are a senior campaign strategist.
+
+Draft a short campaign plan for the brief below. Cover channel mix,
+messaging angle and a call to action. Keep it under 200 words.
+
+Campaign: {campaign_name}
+Brand: {brand_name}
+Objective: {objective}
+Target audience: {target_audience}
+Key message: {key_message}
+"""
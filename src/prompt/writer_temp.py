@@ -1 +1,23 @@
 # writer_temp.py
+"""Prompt template for the content writer agent."""
+
+WRITER_PROMPT = """You are an expert marketing copywriter.
+
+Write the campaign copy for the plan below. Follow the brand guidelines
+exactly — tone, terminology and phrasing. Return the copy only.
+
+Plan:
+{plan}
+
+Brand guidelines:
+{context}
+
+Key message to land: {key_message}
+{feedback}
+"""
+
+REGENERATION_FEEDBACK = """
+The previous draft failed brand validation for these reasons:
+{violations}
+Fix every issue while keeping the message intact.
+"""
@@ -1 +1,13 @@
 # embedder.py
+"""Sentence-transformer embedder shared by indexing and retrieval."""
+
+from functools import lru_cache
+
+DEFAULT_EMBED_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+
+
+@lru_cache(maxsize=1)
+def get_embedder(model_name: str = DEFAULT_EMBED_MODEL):
+    from sentence_transformers import SentenceTransformer
+
+    return SentenceTransformer(model_name)
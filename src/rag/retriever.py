@@ -1 +1,62 @@
 # retriever.py
+"""RAG retriever over the FAISS brand-guideline index."""
+
+import json
+from functools import lru_cache
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+from src.rag.embedder import get_embedder
+
+
+class BrandGuidelineRetriever:
+    """Answer brand-guideline queries from the FAISS vector store."""
+
+    def __init__(self, data_dir: str = "data", k: int = 3, mmap: bool = True):
+        self.data_dir = Path(data_dir)
+        index_path = self.data_dir / "vectordb" / "faiss" / "brand_index.bin"
+        chunks_path = self.data_dir / "vectordb" / "faiss" / "chunks.json"
+        if not index_path.exists():
+            raise FileNotFoundError(f"Brand index not found: {index_path}")
+        if mmap:
+            # Memory-mapping lets the kernel page-cache the index file,
+            # so concurrent processes (uvicorn/xdist workers) share pages
+            # instead of each copying the index into RAM.
+            self.index = faiss.read_index(
+                str(index_path), faiss.IO_FLAG_MMAP | faiss.IO_FLAG_READ_ONLY
+            )
+        else:
+            self.index = faiss.read_index(str(index_path))
+        self.chunks = json.loads(chunks_path.read_text(encoding="utf-8"))
+        self.embedder = get_embedder()
+        self.k = k
+
+    def _embed(self, texts: list) -> np.ndarray:
+        return np.asarray(self.embedder.encode(texts), dtype="float32")
+
+    def _run(self, query: str) -> str:
+        """Return the top-k guideline chunks for a single query."""
+        query_vectors = self._embed([query])
+        _, indices = self.index.search(query_vectors, self.k)
+        return "\n\n".join(self.chunks[i] for i in indices[0] if i != -1)
+
+    def batch_run(self, queries: list) -> list:
+        """Answer many queries with one batched FAISS search.
+
+        Stacking all query embeddings into a single (N, d) float32 array
+        amortizes the index probe and the Python↔C++ crossing across the
+        whole batch instead of paying them per query.
+        """
+        query_vectors = self._embed(list(queries))
+        _, indices = self.index.search(query_vectors, self.k)
+        return [
+            "\n\n".join(self.chunks[i] for i in row if i != -1) for row in indices
+        ]
+
+
+@lru_cache(maxsize=None)
+def get_brand_retriever(data_dir: str = "data", k: int = 3) -> BrandGuidelineRetriever:
+    """Cached constructor so the FAISS index is read once per data_dir."""
+    return BrandGuidelineRetriever(data_dir=data_dir, k=k)
@@ -1 +1,196 @@
 # api_routes.py
+"""FastAPI routes for campaign orchestration, generation and validation."""
+
+from fastapi import APIRouter, Depends, HTTPException
+from pydantic import BaseModel
+from sqlalchemy.orm import Session, selectinload
+
+from src.core.brand_validation_agent import get_brand_validator
+from src.core.database import Campaign, TextContent, get_db
+from src.core.image_content_gen import get_image_generator
+from src.core.orchestrator import get_orchestrator
+from src.core.text_content_gen import get_text_generator
+
+router = APIRouter(prefix="/api/v1")
+
+
+class CampaignRequest(BaseModel):
+    campaign_name: str
+    brand_name: str = ""
+    objective: str = ""
+    target_audience: str = ""
+    key_message: str = ""
+
+
+class TextRequest(BaseModel):
+    prompt: str
+    temperature: float = 0.7
+    max_tokens: int = 1024
+
+
+class ImageRequest(BaseModel):
+    prompt: str
+    width: int = 1024
+    height: int = 1024
+    seed: int | None = None
+
+
+class ValidationRequest(BaseModel):
+    text: str
+
+
+def _campaign_dict(campaign: Campaign) -> dict:
+    return {
+        "campaign_id": campaign.campaign_id,
+        "campaign_name": campaign.campaign_name,
+        "brand_name": campaign.brand_name,
+        "objective": campaign.objective,
+        "target_audience": campaign.target_audience,
+        "key_message": campaign.key_message,
+        "status": campaign.status,
+    }
+
+
+def _result_dict(result: TextContent) -> dict:
+    return {
+        "text_id": result.text_id,
+        "campaign_id": result.campaign_id,
+        "generated_text": result.generated_text,
+        "image_url": result.image_url,
+        "agent_name": result.agent_name,
+    }
+
+
+@router.post("/orchestrate/campaign")
+def orchestrate_campaign(
+    request: CampaignRequest,
+    auto_regenerate: bool = True,
+    max_attempts: int = 3,
+    db: Session = Depends(get_db),
+):
+    """Run the full agent pipeline and persist the campaign.
+
+    Returns the structured contract the frontend relies on:
+    ``{"campaign_id", "status", "attempts", "result": {"text", "image_url"}}``.
+    """
+    crew = get_orchestrator()
+    inputs = request.model_dump()
+    if auto_regenerate:
+        outcome = crew.run_with_auto_regeneration(inputs, max_attempts=max_attempts)
+    else:
+        outcome = crew.run_campaign(inputs)
+
+    # One flush + commit for campaign and result instead of two round trips.
+    campaign = Campaign(**inputs, status=outcome["status"])
+    campaign.results = [
+        TextContent(
+            generated_text=outcome["result"]["text"],
+            image_url=outcome["result"]["image_url"],
+            agent_name="Writer",
+        )
+    ]
+    db.add(campaign)
+    db.commit()
+    return {
+        "campaign_id": campaign.campaign_id,
+        "status": outcome["status"],
+        "attempts": outcome["attempts"],
+        "result": outcome["result"],
+    }
+
+
+@router.post("/orchestrate/campaign/{campaign_id}/regenerate")
+def regenerate_campaign(
+    campaign_id: str, max_attempts: int = 3, db: Session = Depends(get_db)
+):
+    campaign = db.get(Campaign, campaign_id)
+    if campaign is None:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    crew = get_orchestrator()
+    inputs = {
+        "campaign_name": campaign.campaign_name,
+        "brand_name": campaign.brand_name,
+        "objective": campaign.objective,
+        "target_audience": campaign.target_audience,
+        "key_message": campaign.key_message,
+    }
+    outcome = crew.run_with_auto_regeneration(inputs, max_attempts=max_attempts)
+    campaign.status = outcome["status"]
+    db.add(
+        TextContent(
+            campaign_id=campaign.campaign_id,
+            generated_text=outcome["result"]["text"],
+            image_url=outcome["result"]["image_url"],
+            agent_name="Writer",
+        )
+    )
+    db.commit()
+    return {
+        "campaign_id": campaign.campaign_id,
+        "status": outcome["status"],
+        "attempts": outcome["attempts"],
+        "result": outcome["result"],
+    }
+
+
+@router.post("/generate/text")
+def generate_text(request: TextRequest):
+    text = get_text_generator().generate_text(
+        request.prompt, temperature=request.temperature, max_tokens=request.max_tokens
+    )
+    return {"text": text}
+
+
+@router.post("/generate/image")
+def generate_image(request: ImageRequest):
+    image_url = get_image_generator().generate(
+        request.prompt, width=request.width, height=request.height, seed=request.seed
+    )
+    return {"image_url": image_url}
+
+
+@router.post("/validate/text")
+def validate_text(request: ValidationRequest):
+    return get_brand_validator().validate(request.text).to_dict()
+
+
+@router.post("/campaigns/")
+def create_campaign(request: CampaignRequest, db: Session = Depends(get_db)):
+    """Create a draft campaign row without running the agent pipeline."""
+    campaign = Campaign(**request.model_dump())
+    db.add(campaign)
+    db.commit()
+    db.refresh(campaign)
+    return _campaign_dict(campaign)
+
+
+@router.get("/campaigns/")
+def list_campaigns(include: str | None = None, db: Session = Depends(get_db)):
+    """List campaigns; ``?include=results`` embeds each campaign's results.
+
+    Embedding lets the frontend fetch everything in one round-trip
+    instead of issuing one /results request per campaign.
+    """
+    if include == "results":
+        campaigns = db.query(Campaign).options(selectinload(Campaign.results)).all()
+        return [
+            {**_campaign_dict(c), "results": [_result_dict(r) for r in c.results]}
+            for c in campaigns
+        ]
+    return [_campaign_dict(c) for c in db.query(Campaign).all()]
+
+
+@router.get("/campaigns/{campaign_id}")
+def get_campaign(campaign_id: str, db: Session = Depends(get_db)):
+    campaign = db.get(Campaign, campaign_id)
+    if campaign is None:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return _campaign_dict(campaign)
+
+
+@router.get("/campaigns/{campaign_id}/results")
+def get_campaign_results(campaign_id: str, db: Session = Depends(get_db)):
+    campaign = db.get(Campaign, campaign_id)
+    if campaign is None:
+        raise HTTPException(status_code=404, detail="Campaign not found")
+    return [_result_dict(r) for r in campaign.results]
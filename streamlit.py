@@ -1 +1,289 @@
 # streamlit.py
+"""Streamlit frontend for the Agentic CX Content Studio."""
+
+import io
+import re
+import sys
+from pathlib import Path
+
+import requests
+import streamlit as st
+
+# Make the src package importable exactly once; reruns skip the insert.
+_HERE = str(Path(__file__).resolve().parent)
+if _HERE not in sys.path:
+    sys.path.insert(0, _HERE)
+
+BACKEND_ROOT = "http://localhost:8000"
+API_BASE = f"{BACKEND_ROOT}/api/v1"
+_VIEW_PAGE = Path("pages/view_campaigns.py")
+
+
+@st.cache_resource
+def _has_view_page() -> bool:
+    """stat() the multipage entry once per process, not per rerun."""
+    return _VIEW_PAGE.exists()
+
+
+@st.cache_resource
+def get_http() -> requests.Session:
+    """Shared HTTP session so reruns reuse pooled connections."""
+    session = requests.Session()
+    # Ask for compressed JSON; the backend's GZipMiddleware shrinks the
+    # multi-KB campaign payloads on the wire.
+    session.headers.update({"Accept-Encoding": "gzip, br", "Accept": "application/json"})
+    return session
+
+
+@st.cache_resource
+def _get_parser():
+    """Load the document parser lazily.
+
+    The parser pulls in PyPDF2 / python-docx, which are slow imports.
+    Deferring the import until a brief is actually uploaded keeps the
+    first page paint fast, and ``st.cache_resource`` makes the import a
+    one-time cost per server process.
+    """
+    from src.processing.document_parser import parse_uploaded_document
+
+    return parse_uploaded_document
+
+
+@st.cache_data(show_spinner=False)
+def _parse_cached(name: str, size: int, content: bytes) -> dict:
+    """Parse an uploaded brief once per unique file.
+
+    Streamlit reruns the whole script on every widget change; keying the
+    cache on the file name, size and raw bytes means tweaking an
+    unrelated field returns the already-parsed dict instead of re-doing
+    PDF/DOCX extraction.
+    """
+    buffer = io.BytesIO(content)
+    buffer.name = name
+    return _get_parser()(buffer)
+
+
+@st.cache_data(ttl=5, show_spinner=False)
+def _backend_up() -> bool:
+    """Cheap pre-flight probe so one outage costs one failed connect.
+
+    Cached for a few seconds per session; every HTTP-using branch checks
+    this instead of paying a TCP connect+exception-unwind per call.
+    """
+    try:
+        get_http().get(f"{BACKEND_ROOT}/health", timeout=0.5)
+        return True
+    except requests.exceptions.RequestException:
+        return False
+
+
+@st.cache_data(ttl=3600, show_spinner=False)
+def _fetch_image_bytes(url: str) -> bytes:
+    """Download an image once per URL.
+
+    Passing bytes to st.image lets Streamlit hash-cache the payload, so
+    the backend round-trip happens only when the URL changes rather than
+    on every rerun.
+    """
+    return get_http().get(url, timeout=10).content
+
+
+_URL_RE = re.compile(r"https?://[^\s'\"]+|/static/[^\s'\"]+")
+
+
+def _absolute_url(image_url: str) -> str:
+    if image_url.startswith("/"):
+        return f"{BACKEND_ROOT}{image_url}"
+    return image_url
+
+
+def _campaign_state(data: dict) -> dict:
+    """Read the structured orchestration payload into session-state form.
+
+    The backend guarantees ``result`` is ``{"text": str, "image_url": str}``,
+    so no defensive parsing is needed here.
+    """
+    result = data["result"]
+    return {
+        "campaign_id": data.get("campaign_id"),
+        "status": data.get("status"),
+        "attempts": data.get("attempts"),
+        "text": result["text"],
+        "image_url": _absolute_url(result["image_url"]),
+    }
+
+
+def submit_campaign(payload: dict) -> dict:
+    """POST a campaign brief to the orchestration endpoint.
+
+    Single entry point for both the manual form and the upload flow, so
+    connection pooling and any future retry/backoff policy live in one
+    place on the shared session.
+    """
+    response = get_http().post(
+        f"{API_BASE}/orchestrate/campaign",
+        json=payload,
+        params={"auto_regenerate": True, "max_attempts": 3},
+        timeout=(3, 180),
+    )
+    response.raise_for_status()
+    return response.json()
+
+
+def _split_legacy_result(raw) -> tuple:
+    """Fallback for campaign results stored before the structured contract."""
+    raw = str(raw)
+    image_url = ""
+    text_content = raw
+    match = _URL_RE.search(raw)
+    if match:
+        image_url = match.group().rstrip(".,;:)")
+        # Slice around the match offsets instead of str.replace, which
+        # would rescan the whole payload for a position we already know.
+        text_content = (raw[: match.start()] + raw[match.end() :]).strip()
+    return text_content, _absolute_url(image_url)
+
+
+st.set_page_config(page_title="Agentic CX Content Studio", page_icon="🎨", layout="wide")
+st.title("🎨 Agentic CX Content Studio")
+
+page = st.sidebar.radio("Navigation", ["Create Campaign", "View Campaigns"])
+
+if page == "Create Campaign":
+    st.header("Create a New Campaign")
+    input_mode = st.radio(
+        "How would you like to start?",
+        ["Manual entry", "Upload a brief"],
+        horizontal=True,
+    )
+
+    if input_mode == "Upload a brief":
+        uploaded_file = st.file_uploader(
+            "Campaign brief (PDF, DOCX or TXT)", type=["pdf", "docx", "txt"]
+        )
+        if uploaded_file is not None:
+            content = uploaded_file.getvalue()
+            with st.spinner("Parsing document..."):
+                extracted_data = _parse_cached(uploaded_file.name, len(content), content)
+            st.success("Brief parsed — review the extracted details below.")
+            st.json(extracted_data)
+
+            if st.button("🚀 Create Campaign from Brief"):
+                payload = {
+                    "campaign_name": extracted_data.get("campaign_name", uploaded_file.name),
+                    "brand_name": extracted_data.get("brand_name", ""),
+                    "objective": extracted_data.get("objective", ""),
+                    "target_audience": extracted_data.get("target_audience", ""),
+                    "key_message": extracted_data.get("key_message", ""),
+                }
+                if not _backend_up():
+                    st.error("Backend unreachable — is the FastAPI server running on port 8000?")
+                    st.stop()
+                try:
+                    with st.spinner("Agents are planning, writing and validating..."):
+                        st.session_state.current_campaign = _campaign_state(
+                            submit_campaign(payload)
+                        )
+                except requests.exceptions.HTTPError as exc:
+                    st.error(f"Campaign creation failed: {exc}")
+    else:
+        with st.form("manual_campaign_form"):
+            campaign_name = st.text_input("Campaign name")
+            brand_name = st.text_input("Brand name")
+            objective = st.text_area("Objective")
+            target_audience = st.text_input("Target audience")
+            key_message = st.text_area("Key message")
+            submitted = st.form_submit_button("🚀 Create Campaign")
+        if submitted:
+            payload = {
+                "campaign_name": campaign_name,
+                "brand_name": brand_name,
+                "objective": objective,
+                "target_audience": target_audience,
+                "key_message": key_message,
+            }
+            if not _backend_up():
+                st.error("Backend unreachable — is the FastAPI server running on port 8000?")
+                st.stop()
+            try:
+                with st.spinner("Agents are planning, writing and validating..."):
+                    st.session_state.current_campaign = _campaign_state(
+                        submit_campaign(payload)
+                    )
+            except requests.exceptions.HTTPError as exc:
+                st.error(f"Campaign creation failed: {exc}")
+
+    if "current_campaign" in st.session_state:
+        campaign = st.session_state.current_campaign
+        st.divider()
+        st.subheader("Generated Campaign")
+
+        # Action buttons come before the content render: mutating
+        # session state in place is then reflected on this same rerun,
+        # with no extra st.rerun() script execution.
+        col1, col2 = st.columns(2)
+        with col1:
+            if st.button("🔄 Regenerate Content"):
+                if not _backend_up():
+                    st.error("Backend unreachable — is the FastAPI server running on port 8000?")
+                    st.stop()
+                with st.spinner("Regenerating with validator feedback..."):
+                    response = get_http().post(
+                        f"{API_BASE}/orchestrate/campaign/{campaign['campaign_id']}/regenerate",
+                        timeout=(3, 180),
+                    )
+                if response.status_code == 200:
+                    st.session_state.current_campaign.update(
+                        _campaign_state(response.json())
+                    )
+                else:
+                    st.error(f"Regeneration failed: {response.status_code}")
+        with col2:
+            if st.button("📋 View All Campaigns"):
+                if _has_view_page():
+                    st.switch_page(str(_VIEW_PAGE))
+                else:
+                    st.info("Select 'View Campaigns' in the sidebar to browse saved campaigns.")
+
+        status = campaign.get("status", "unknown")
+        if status == "approved":
+            st.success(f"Status: {status} (attempts: {campaign.get('attempts')})")
+        else:
+            st.warning(f"Status: {status} (attempts: {campaign.get('attempts')})")
+        st.markdown(campaign.get("text", ""))
+        if campaign.get("image_url"):
+            st.image(
+                _fetch_image_bytes(campaign["image_url"]),
+                use_container_width=True,
+                caption="Generated visual",
+            )
+else:
+    st.header("📋 Saved Campaigns")
+    if not _backend_up():
+        st.error("Backend unreachable — is the FastAPI server running on port 8000?")
+        st.stop()
+    response = get_http().get(
+        f"{API_BASE}/campaigns/", params={"include": "results"}, timeout=10
+    )
+    if response.status_code != 200:
+        st.error(f"Could not load campaigns: {response.status_code}")
+        st.stop()
+    campaigns = response.json()
+    if not campaigns:
+        st.info("No campaigns yet — create one from the Create Campaign page.")
+    for campaign in campaigns:
+        label = f"{campaign['campaign_name']} — {campaign.get('status', 'draft')}"
+        with st.expander(label):
+            st.write(f"**Brand:** {campaign.get('brand_name', '—')}")
+            st.write(f"**Objective:** {campaign.get('objective', '—')}")
+            for result in campaign.get("results", []):
+                if "image_url" in result:
+                    text_content = result.get("generated_text", "")
+                    image_url = _absolute_url(result.get("image_url") or "")
+                else:
+                    text_content, image_url = _split_legacy_result(
+                        result.get("generated_text", "")
+                    )
+                st.markdown(text_content)
+                if image_url:
+                    st.image(_fetch_image_bytes(image_url), use_container_width=True)
@@ -1 +1,23 @@
 # test_api_integ.py
+"""Integration tests for backend liveness: database and API health."""
+
+# sys.path setup lives in the root conftest.py.
+from src.core.database import engine
+
+
+def test_db_connection():
+    # exec_driver_sql skips SQLAlchemy compilation for the trivial
+    # literal and goes straight to the DBAPI.
+    with engine.connect() as conn:
+        assert conn.exec_driver_sql("SELECT 1").scalar() == 1
+
+
+def test_health_endpoint():
+    from fastapi.testclient import TestClient
+
+    from main import app
+
+    with TestClient(app) as client:
+        response = client.get("/health")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ok"}
@@ -0,0 +1,93 @@
+# conftest.py
+"""Fixtures local to the unit suite."""
+
+import os
+from contextlib import contextmanager
+
+import pytest
+
+
+@pytest.fixture(autouse=True, scope="session")
+def _api_keys():
+    """Set test API keys once per session.
+
+    The generator tests all need the keys present; setting them here
+    replaces a setenv in every test. Missing-key tests delenv with their
+    own function-scoped monkeypatch, which restores these values after.
+    """
+    keys = {"GROQ_API_KEY": "test-key", "REPLICATE_API_TOKEN": "test-token"}
+    previous = {name: os.environ.get(name) for name in keys}
+    os.environ.update(keys)
+    yield
+    for name, value in previous.items():
+        if value is None:
+            os.environ.pop(name, None)
+        else:
+            os.environ[name] = value
+
+
+@contextmanager
+def _noop_run(*args, **kwargs):
+    yield None
+
+
+@pytest.fixture(autouse=True)
+def _disable_mlflow(monkeypatch):
+    """No-op MLflow tracking for the whole unit suite.
+
+    One autouse fixture replaces the @patch(\"mlflow.*\") decorator stack
+    every generator test used to carry; no unit test should ever write a
+    real tracking run.
+    """
+    monkeypatch.setattr("mlflow.start_run", _noop_run)
+    monkeypatch.setattr("mlflow.log_param", lambda *args, **kwargs: None)
+    monkeypatch.setattr("mlflow.log_metric", lambda *args, **kwargs: None)
+
+
+@pytest.fixture
+def db_session(test_engine, testing_session_factory):
+    """Connection-bound session rolled back after each test.
+
+    The schema is created once per session by test_engine; rollback
+    replaces per-test DROP+CREATE, so tests pay zero DDL.
+    """
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = testing_session_factory(bind=connection)
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_compiled_kb_cache():
+    """Keep the compiled-KB cache from leaking mocks between tests.
+
+    The brand-validator tests patch get_kb_loader per test; without the
+    clear, the first test's mock KB would be served to every later one.
+    """
+    from src.core.brand_validation_agent import _compile_kb
+
+    _compile_kb.cache_clear()
+    yield
+    _compile_kb.cache_clear()
+
+
+@pytest.fixture(autouse=True, scope="session")
+def stub_faiss_index():
+    """Swap the on-disk brand index for a tiny in-memory one.
+
+    The unit tests mock the generators and validator but can still load
+    the real FAISS index transitively through main.app. A 100-vector
+    IndexFlatL2 keeps the retriever functional without touching disk.
+    """
+    import faiss
+    import numpy as np
+
+    index = faiss.IndexFlatL2(384)
+    index.add(np.random.default_rng(0).random((100, 384), dtype=np.float32))
+    mp = pytest.MonkeyPatch()
+    mp.setattr("src.rag.retriever.faiss.read_index", lambda path, *flags: index)
+    yield
+    mp.undo()
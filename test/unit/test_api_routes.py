@@ -0,0 +1,119 @@
+# test_api_routes.py
+"""Unit tests for the FastAPI routes against a throwaway SQLite database."""
+
+from unittest.mock import patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+# The throwaway-DB engine lives in the root conftest.py (test_engine /
+# app_with_test_db); the get_db override is installed per test by the
+# autouse db_session fixture below so the shared app object is never
+# left pointing at the test database for other suites.
+
+
+@pytest.fixture(scope="session")
+def client(app_with_test_db):
+    with TestClient(app_with_test_db) as c:
+        yield c
+
+
+@pytest.fixture(autouse=True)
+def db_session(test_engine, testing_session_factory, app_with_test_db):
+    """Run every route test inside a transaction rolled back on teardown.
+
+    The FastAPI dependency is pointed at the same connection-bound
+    session, so endpoint and test observe identical state and rows
+    committed through the API never leak into the shared engine for
+    other modules to see.
+    """
+    from src.core.database import get_db
+
+    connection = test_engine.connect()
+    transaction = connection.begin()
+    session = testing_session_factory(bind=connection)
+
+    def _override():
+        yield session
+
+    app_with_test_db.dependency_overrides[get_db] = _override
+    yield session
+    app_with_test_db.dependency_overrides.pop(get_db, None)
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+def _campaign_payload(name="Unit Test Campaign"):
+    return {
+        "campaign_name": name,
+        "brand_name": "TestBrand",
+        "objective": "Coverage",
+        "target_audience": "Developers",
+        "key_message": "Ship it",
+    }
+
+
+def test_create_campaign(client):
+    response = client.post("/api/v1/campaigns/", json=_campaign_payload())
+    assert response.status_code == 200
+    assert response.json()["campaign_id"]
+
+
+def test_list_campaigns(client):
+    client.post("/api/v1/campaigns/", json=_campaign_payload("Listable"))
+    response = client.get("/api/v1/campaigns/")
+    assert response.status_code == 200
+    assert any(c["campaign_name"] == "Listable" for c in response.json())
+
+
+def test_get_campaign_not_found(client):
+    response = client.get("/api/v1/campaigns/does-not-exist")
+    assert response.status_code == 404
+
+
+def test_validate_endpoint(client):
+    with patch("src.routes.api_routes.get_brand_validator") as mock_validator:
+        mock_validator.return_value.validate.return_value.to_dict.return_value = {
+            "is_valid": True,
+            "violations": [],
+            "warnings": [],
+            "detected_tone": "positive",
+            "missing_keywords": [],
+            "forbidden_words_found": [],
+        }
+        response = client.post(
+            "/api/v1/validate/text", json={"text": "Together we achieve."}
+        )
+    assert response.status_code == 200
+    assert response.json()["is_valid"] is True
+
+
+def test_generate_text_endpoint(client):
+    with patch("src.routes.api_routes.get_text_generator") as mock_generator:
+        mock_generator.return_value.generate_text.return_value = "Mocked copy"
+        response = client.post("/api/v1/generate/text", json={"prompt": "Write copy"})
+    assert response.status_code == 200
+    assert response.json() == {"text": "Mocked copy"}
+
+
+def test_regenerate_endpoint(client):
+    created = client.post("/api/v1/campaigns/", json=_campaign_payload("Regen")).json()
+    with patch("src.routes.api_routes.get_orchestrator") as mock_orchestrator:
+        mock_orchestrator.return_value.run_with_auto_regeneration.return_value = {
+            "status": "approved",
+            "attempts": 2,
+            "result": {"text": "Regenerated copy", "image_url": "/static/test.png"},
+        }
+        response = client.post(
+            f"/api/v1/orchestrate/campaign/{created['campaign_id']}/regenerate"
+        )
+    assert response.status_code == 200
+    data = response.json()
+    assert data["status"] == "approved"
+    assert data["result"]["text"] == "Regenerated copy"
+
+
+def test_regenerate_unknown_campaign(client):
+    response = client.post("/api/v1/orchestrate/campaign/missing/regenerate")
+    assert response.status_code == 404
@@ -0,0 +1,140 @@
+# test_brand_validator.py
+"""Unit tests for the BrandValidator against a stubbed knowledge base."""
+
+import pytest
+
+from src.core.brand_validation_agent import (
+    BrandValidator,
+    Tone,
+    get_brand_validator,
+)
+
+_FORBIDDEN = ["cheap", "guaranteed", "spam", "scam"]
+_ALLOWED = ["premium quality", "trusted by customers"]
+_TONE_PROFILE = {
+    "preferred_tone": ["innovative", "premium", "trusted"],
+    "disallowed_tone": ["terrible", "awful", "hate"],
+}
+_REQUIRED = ["brand"]
+
+
+class _FakeKB:
+    """Plain stub: no MagicMock attribute bookkeeping per access."""
+
+    def get_all_forbidden_terms(self):
+        return _FORBIDDEN
+
+    def get_all_allowed_phrases(self):
+        return _ALLOWED
+
+    def load_tone_profile(self):
+        return _TONE_PROFILE
+
+    def get_required_keywords(self):
+        return _REQUIRED
+
+
+@pytest.fixture
+def mock_kb_loader(monkeypatch):
+    fake = _FakeKB()
+    monkeypatch.setattr(
+        "src.core.brand_validation_agent.get_kb_loader", lambda *_: fake
+    )
+    return fake
+
+
+@pytest.mark.parametrize(
+    ("text", "expect_valid", "forbidden", "violation", "warning"),
+    [
+        pytest.param(
+            "Our brand delivers premium quality you can trust.",
+            True, [], None, None, id="clean",
+        ),
+        pytest.param(
+            "Our brand offers premium quality at a cheap price.",
+            False, ["cheap"], "cheap", None, id="forbidden-term",
+        ),
+        pytest.param(
+            "Our brand: premium quality, never CHEAP.",
+            False, ["cheap"], "cheap", None, id="case-insensitive",
+        ),
+        pytest.param(
+            "This cheap brand is basically spam, guaranteed scam.",
+            False, ["cheap", "spam", "guaranteed", "scam"], None, None,
+            id="multiple-violations", marks=pytest.mark.slow,
+        ),
+        pytest.param("", False, [], "Text is empty", None, id="empty"),
+        pytest.param("   \n\t  ", False, [], "Text is empty", None, id="whitespace"),
+        pytest.param(
+            "Premium quality for everyone.",
+            True, [], None, "brand", id="missing-keyword",
+        ),
+        pytest.param(
+            "Our brand is innovative.",
+            True, [], None, "No approved brand phrasing found",
+            id="no-approved-phrasing",
+        ),
+        pytest.param(
+            "This brand is terrible and awful.",
+            False, [], "Disallowed tone detected", None, id="negative-tone",
+        ),
+    ],
+)
+def test_validate(mock_kb_loader, text, expect_valid, forbidden, violation, warning):
+    """One body for the validation matrix; cases differ only in data."""
+    result = BrandValidator("test_kb").validate(text)
+    assert result.is_valid is expect_valid
+    for term in forbidden:
+        assert term in result.forbidden_words_found
+    if violation is not None:
+        assert any(violation in entry for entry in result.violations)
+    if warning is not None:
+        assert any(warning in entry for entry in result.warnings)
+
+
+def test_validate_batch_matches_single(mock_kb_loader):
+    texts = [
+        "Our brand delivers premium quality you can trust.",
+        "Get this cheap product now, guaranteed.",
+        "",
+        "This brand is terrible and awful.",
+    ]
+    validator = BrandValidator("test_kb")
+    batched = validator.validate_batch(texts)
+    singles = [validator.validate(text) for text in texts]
+    assert [result.to_dict() for result in batched] == [
+        result.to_dict() for result in singles
+    ]
+
+
+def test_detect_positive_tone(mock_kb_loader):
+    validator = BrandValidator("test_kb")
+    result = validator.validate("Our brand is innovative and trusted by customers.")
+    assert result.detected_tone is Tone.POSITIVE
+
+
+def test_detect_negative_tone(mock_kb_loader):
+    validator = BrandValidator("test_kb")
+    result = validator.validate("I hate this awful brand experience.")
+    assert result.detected_tone is Tone.NEGATIVE
+
+
+def test_detect_neutral_tone(mock_kb_loader):
+    validator = BrandValidator("test_kb")
+    result = validator.validate("Our brand sells comfortable shoes.")
+    assert result.detected_tone is Tone.NEUTRAL
+
+
+def test_to_dict_serializes_tone(mock_kb_loader):
+    validator = BrandValidator("test_kb")
+    data = validator.validate("Our brand delivers premium quality.").to_dict()
+    assert data["detected_tone"] in ("positive", "negative", "neutral")
+    assert isinstance(data["violations"], list)
+
+
+def test_get_brand_validator_singleton(mock_kb_loader):
+    get_brand_validator.cache_clear()
+    first = get_brand_validator("test_kb")
+    second = get_brand_validator("test_kb")
+    assert first is second
+    get_brand_validator.cache_clear()
@@ -0,0 +1,76 @@
+# test_database.py
+"""Unit tests for the ORM models against the shared rollback session."""
+
+import pytest
+from sqlalchemy import insert
+
+from src.core.database import Campaign, TextContent
+
+
+def _campaign(name="DB Test Campaign"):
+    return Campaign(
+        campaign_name=name,
+        brand_name="TestBrand",
+        objective="Coverage",
+        target_audience="Developers",
+        key_message="Ship it",
+    )
+
+
+def test_create_campaign(db_session):
+    campaign = _campaign()
+    db_session.add(campaign)
+    db_session.flush()
+    assert campaign.campaign_id
+    assert campaign.status == "draft"
+    assert campaign.created_at is not None
+
+
+def test_create_text_content(db_session):
+    campaign = _campaign("With Result")
+    db_session.add(campaign)
+    db_session.flush()
+
+    content = TextContent(
+        campaign_id=campaign.campaign_id,
+        generated_text="Generated copy",
+        image_url="/static/test.png",
+    )
+    db_session.add(content)
+    db_session.flush()
+    assert content.text_id is not None
+    assert content.agent_name == "Writer"
+    assert content.campaign is campaign
+
+
+@pytest.mark.slow
+def test_cascade_delete_behavior(db_session):
+    campaign = _campaign("Cascade")
+    campaign.results = [
+        TextContent(generated_text=f"Attempt {attempt}") for attempt in range(3)
+    ]
+    db_session.add(campaign)
+    db_session.flush()
+
+    db_session.delete(campaign)
+    db_session.flush()
+    assert db_session.query(TextContent).count() == 0
+
+
+@pytest.mark.slow
+def test_bulk_insert_text_contents(db_session):
+    """Batched executemany insert: one statement for N rows, one flush."""
+    campaign = _campaign("Bulk")
+    db_session.add(campaign)
+    db_session.flush()
+
+    rows = [
+        {
+            "campaign_id": campaign.campaign_id,
+            "generated_text": f"Variant {index}",
+            "agent_name": "Writer",
+        }
+        for index in range(1000)
+    ]
+    db_session.execute(insert(TextContent), rows)
+    assert db_session.query(TextContent).count() == 1000
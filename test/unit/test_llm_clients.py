@@ -1 +1,126 @@
 # test_llm_clients.py
+"""Unit tests for the Groq text and Replicate image generators.
+
+MLflow tracking is no-op'd and the test API keys are set suite-wide by
+autouse fixtures in this package's conftest.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.core.image_content_gen import ImageGenerator, get_image_generator
+from src.core.text_content_gen import TextGenerator, get_text_generator
+
+
+def _mock_groq_response(content="Generated copy", total_tokens=42):
+    # generate_text only reads .choices[0].message.content and
+    # .usage.total_tokens; four SimpleNamespaces cover that without
+    # MagicMock's auto-created child mocks.
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(total_tokens=total_tokens),
+    )
+
+
+@pytest.mark.slow
+def test_text_generator_requires_api_key(monkeypatch):
+    monkeypatch.delenv("GROQ_API_KEY", raising=False)
+    with patch("src.core.text_content_gen._env_loaded"):
+        with pytest.raises(ValueError, match="GROQ_API_KEY"):
+            TextGenerator()
+
+
+def test_generate_text():
+    with patch("src.core.text_content_gen.Groq") as mock_groq:
+        mock_groq.return_value.chat.completions.create.return_value = (
+            _mock_groq_response()
+        )
+        generator = TextGenerator()
+        text = generator.generate_text("Write campaign copy")
+    assert text == "Generated copy"
+
+
+def test_generate_text_passes_parameters():
+    with patch("src.core.text_content_gen.Groq") as mock_groq:
+        create = mock_groq.return_value.chat.completions.create
+        create.return_value = _mock_groq_response()
+        TextGenerator().generate_text("Write copy", temperature=0.2, max_tokens=256)
+    _, kwargs = create.call_args
+    assert kwargs["temperature"] == 0.2
+    assert kwargs["max_tokens"] == 256
+
+
+@pytest.mark.asyncio
+async def test_agenerate_text():
+    with patch("src.core.text_content_gen.Groq"), patch(
+        "src.core.text_content_gen.AsyncGroq"
+    ) as mock_async:
+        mock_async.return_value.chat.completions.create = AsyncMock(
+            return_value=_mock_groq_response("Async copy")
+        )
+        text = await TextGenerator().agenerate_text("Write campaign copy")
+    assert text == "Async copy"
+
+
+def test_generate_batch():
+    with patch("src.core.text_content_gen.Groq"), patch(
+        "src.core.text_content_gen.AsyncGroq"
+    ) as mock_async:
+        create = AsyncMock(return_value=_mock_groq_response())
+        mock_async.return_value.chat.completions.create = create
+        results = TextGenerator().generate_batch(["one", "two", "three"])
+    assert results == ["Generated copy"] * 3
+    assert create.await_count == 3
+
+
+def test_get_text_generator_singleton():
+    get_text_generator.cache_clear()
+    with patch("src.core.text_content_gen.Groq"):
+        first = get_text_generator()
+        second = get_text_generator()
+    assert first is second
+    get_text_generator.cache_clear()
+
+
+@pytest.mark.slow
+def test_image_generator_requires_token(monkeypatch):
+    monkeypatch.delenv("REPLICATE_API_TOKEN", raising=False)
+    with patch("src.core.image_content_gen._env_loaded"):
+        with pytest.raises(ValueError, match="REPLICATE_API_TOKEN"):
+            ImageGenerator()
+
+
+def test_generate_image():
+    with patch("src.core.image_content_gen.replicate.run") as mock_replicate:
+        mock_replicate.return_value = ["https://example.com/image.png"]
+        url = ImageGenerator().generate("A mountain at dusk")
+    assert url == "https://example.com/image.png"
+    mock_replicate.assert_called_once()
+
+
+def test_generate_image_passes_seed():
+    with patch("src.core.image_content_gen.replicate.run") as mock_replicate:
+        mock_replicate.return_value = "https://example.com/image.png"
+        ImageGenerator().generate("A mountain at dusk", seed=7)
+    _, kwargs = mock_replicate.call_args
+    assert kwargs["input"]["seed"] == 7
+
+
+def test_generate_image_cached():
+    with patch("src.core.image_content_gen.replicate.run") as mock_replicate:
+        mock_replicate.return_value = "https://example.com/image.png"
+        generator = ImageGenerator()
+        first = generator.generate("A mountain at dusk", seed=7)
+        second = generator.generate("A mountain at dusk", seed=7)
+    assert first == second
+    mock_replicate.assert_called_once()
+
+
+def test_get_image_generator_singleton():
+    get_image_generator.cache_clear()
+    first = get_image_generator()
+    second = get_image_generator()
+    assert first is second
+    get_image_generator.cache_clear()